@@ -11,26 +11,88 @@
 /**
  * @typedef {{
  *   pieceIdx: number,
+ *   placementIdx: number,
  *   r: number,
  *   c: number,
- *   cells: Cell[],
+ *   cells: readonly Cell[],
  * }} Solution
  */
 
+/**
+ * Precomputed solutions: the placement indices of one tiling for each
+ * date, keyed by `${month},${day}`.
+ * @typedef {Record<string, number[]>} SolutionTable
+ */
+
 /**
  * @typedef {{
  *   pieceIdx: number,
  *   r: number,
  *   c: number,
- *   bits: bigint,
- *   cellsList: Cell[],
+ *   lo: number,
+ *   hi: number,
+ *   cellsList: readonly Cell[],
  * }} Placement
  */
 
+/**
+ * Flattened placement data for the exact cover search.
+ * @typedef {{
+ *   placementLo: Int32Array,
+ *   placementHi: Int32Array,
+ *   placementPiece: Int32Array,
+ *   cellOffsets: Int32Array,
+ *   cellPlacements: Int32Array,
+ *   minPieceSize: Int32Array,
+ *   uniformPieceSize: Int32Array,
+ *   allPieces: number,
+ *   targetLo: number,
+ *   targetHi: number,
+ * }} SearchTables
+ */
+
 /**
  * @typedef {'Jan' | 'Feb' | 'Mar' | 'Apr' | 'May' | 'Jun' | 'Jul' | 'Aug' | 'Sep' | 'Oct' | 'Nov' | 'Dec'} Month
  */
 
+/**
+ * Bit index at which the high word of a bitboard starts (the first cell of
+ * row 4). Keeping each word under 32 bits lets the solver use plain integer
+ * bitwise operators instead of BigInt arithmetic.
+ */
+const HI_WORD_OFFSET = 28;
+
+/** The seven bits of one board row. */
+const ROW_MASK = 0x7f;
+
+/** Every bit outside column 0, in either bitboard word. */
+const NOT_COL_0 = ~0x204081;
+
+/** Every bit outside column 6, in either bitboard word. */
+const NOT_COL_6 = ~(0x204081 << 6);
+
+/**
+ * A 2x2 matrix `[a, b, c, d]` mapping cell `[r, col]` to
+ * `[a * r + b * col, c * r + d * col]`.
+ * @typedef {[number, number, number, number]} Symmetry
+ */
+
+/**
+ * The eight symmetries of the square: four rotations, each optionally
+ * mirrored. Applying all of them yields every orientation of a piece.
+ * @type {Symmetry[]}
+ */
+const SYMMETRIES = [
+  [1, 0, 0, 1],
+  [0, 1, -1, 0],
+  [-1, 0, 0, -1],
+  [0, -1, 1, 0],
+  [1, 0, 0, -1],
+  [0, -1, -1, 0],
+  [-1, 0, 0, 1],
+  [0, 1, 1, 0],
+];
+
 /**
  * Calendar Puzzle Solver
  *
@@ -183,25 +245,53 @@ class CalendarPuzzle {
       this.getAllOrientations(p)
     );
 
-    // Pre-compute cell index mapping for bitboard operations
-    /** @type {Map<`${number},${number}`, number>} */
-    this.cellToIndex = new Map();
-    /** @type {[number, number][]} */
-    this.indexToCell = [];
-    let cellIdx = 0;
-    for (const cellKey of this.validCells) {
-      this.cellToIndex.set(cellKey, cellIdx);
-      const parts = cellKey.split(",").map(Number);
-      const r = parts[0];
-      const c = parts[1];
-      if (r !== undefined && c !== undefined) {
-        this.indexToCell.push([r, c]);
+    // Bitboards index cell (r, c) as bit r * 7 + c. JS bitwise operators
+    // work on 32-bit integers, so the 49 bits are split across two words:
+    // rows 0-3 live in the low word and rows 4-6 in the high word.
+    const [validLo, validHi] = this.cellsToBits(
+      Array.from(this.validCells, (key) =>
+        /** @type {Cell} */ (key.split(",").map(Number))
+      )
+    );
+
+    /** @type {number} */
+    this.validLo = validLo;
+
+    /** @type {number} */
+    this.validHi = validHi;
+
+    // Pre-compute all possible placements for all pieces. The search tables
+    // and the solution output both index into this one list.
+    this.placements = this.precomputeAllPlacements();
+
+    // Pre-compute the exact cover tables shared by every solve
+    this.searchTables = this.buildSearchTables(this.placements);
+
+    /**
+     * Search tables specialized to the most recently solved date, keyed by
+     * `${month},${day}`
+     * @type {{ key: string, tables: SearchTables } | null}
+     */
+    this.dateSearchTables = null;
+  }
+
+  /**
+   * Convert board cells to a two-word bitboard.
+   * @param {readonly Cell[]} cells
+   * @returns {[number, number]} The low (rows 0-3) and high (rows 4-6) words
+   */
+  cellsToBits(cells) {
+    let lo = 0;
+    let hi = 0;
+    for (const [r, c] of cells) {
+      const bitIndex = r * this.cols + c;
+      if (bitIndex < HI_WORD_OFFSET) {
+        lo |= 1 << bitIndex;
+      } else {
+        hi |= 1 << (bitIndex - HI_WORD_OFFSET);
       }
-      cellIdx++;
     }
-
-    // Pre-compute all possible placements for all pieces
-    this.globalPlacements = this.precomputeAllPlacements();
+    return [lo, hi];
   }
 
   /**
@@ -253,52 +343,33 @@ class CalendarPuzzle {
   }
 
   /**
+   * Canonical form of a piece: each cell shifted so the piece touches row 0
+   * and column 0, packed into one integer `r * 16 + c`, and sorted. Pieces
+   * narrower than 16 cells have the same shape exactly when their canonical
+   * forms match.
    * @param {Piece} piece
-   * @returns {Piece}
+   * @returns {number[]}
    */
-  normalizePiece(piece) {
-    if (piece.length === 0) return piece;
-    const minRow = Math.min(...piece.map(([r, c]) => r));
-    const minCol = Math.min(...piece.map(([r, c]) => c));
+  canonicalCells(piece) {
+    let minRow = Infinity;
+    let minCol = Infinity;
+    for (const [r, c] of piece) {
+      minRow = Math.min(minRow, r);
+      minCol = Math.min(minCol, c);
+    }
     return piece
-      .map(
-        /** @type {(coords: [number, number]) => [number, number]} */
-        ([r, c]) => [r - minRow, c - minCol]
-      )
-      .sort((a, b) => (a[0] !== b[0] ? a[0] - b[0] : a[1] - b[1]));
+      .map(([r, c]) => (r - minRow) * 16 + (c - minCol))
+      .sort((a, b) => a - b);
   }
 
   /**
+   * Apply a linear map to every cell of a piece.
    * @param {Piece} piece
+   * @param {Symmetry} symmetry
    * @returns {Piece}
    */
-  rotate90(piece) {
-    return piece.map(([r, c]) => [c, -r]);
-  }
-
-  /**
-   *
-   * @param {Piece} piece
-   * @returns {Piece}
-   */
-  flipHorizontal(piece) {
-    return piece.map(([r, c]) => [r, -c]);
-  }
-
-  /**
-   * Convert piece coordinates to a bitboard representation for deduplication.
-   * Uses the piece's shape as a unique identifier.
-   * @param {Piece} piece
-   * @returns {bigint}
-   */
-  pieceToBitboard(piece) {
-    let bitboard = 0n;
-    for (const [r, c] of piece) {
-      // Encode position in bitboard (assuming piece fits in 8x8 grid)
-      const bitIndex = r * 8 + c;
-      bitboard |= 1n << BigInt(bitIndex);
-    }
-    return bitboard;
+  transformPiece(piece, [a, b, c, d]) {
+    return piece.map(([r, col]) => [a * r + b * col, c * r + d * col]);
   }
 
   /**
@@ -306,28 +377,20 @@ class CalendarPuzzle {
    * @returns {Piece[]}
    */
   getAllOrientations(piece) {
-    /** @type {Map<bigint, Piece>} */
+    /** @type {Map<string, Piece>} */
     const orientations = new Map();
-    let current = piece;
-
-    // Try all 4 rotations
-    for (let i = 0; i < 4; i++) {
-      const normalized = this.normalizePiece(current);
-      const bitboard = this.pieceToBitboard(normalized);
-      if (!orientations.has(bitboard)) {
-        orientations.set(bitboard, normalized);
-      }
 
-      // Also try flipped version
-      const flipped = this.flipHorizontal(current);
-      const normalizedFlipped = this.normalizePiece(flipped);
-      const bitboardFlipped = this.pieceToBitboard(normalizedFlipped);
-      if (!orientations.has(bitboardFlipped)) {
-        orientations.set(bitboardFlipped, normalizedFlipped);
+    for (const symmetry of SYMMETRIES) {
+      const canonical = this.canonicalCells(
+        this.transformPiece(piece, symmetry)
+      );
+      const key = canonical.join();
+      if (!orientations.has(key)) {
+        orientations.set(
+          key,
+          canonical.map((packed) => [packed >> 4, packed & 15])
+        );
       }
-
-      // Rotate for next iteration
-      current = this.rotate90(current);
     }
 
     return Array.from(orientations.values());
@@ -336,82 +399,175 @@ class CalendarPuzzle {
   /**
    * Pre-compute all possible placements for all pieces across the entire board.
    * This is done once at construction time rather than every solve.
-   * @returns {Placement[][]}
+   * @returns {Placement[]}
    */
   precomputeAllPlacements() {
-    /** @type {Placement[][]} */
-    const allPlacements = [];
+    /** @type {Placement[]} */
+    const placements = [];
 
     for (let pieceIdx = 0; pieceIdx < this.pieces.length; pieceIdx++) {
-      const piece = this.pieces[pieceIdx];
-      if (!piece) continue;
-
-      /** @type {Placement[]} */
-      const placements = [];
-
       // Use cached orientations instead of recomputing
       const orientations = this.cachedOrientations[pieceIdx];
       if (!orientations) continue;
 
       for (const orientation of orientations) {
-        for (let r = 0; r < this.rows; r++) {
-          for (let c = 0; c < this.cols; c++) {
-            const cells = orientation.map(
-              /** @type {(d: [number, number]) => Cell} */
-              ([dr, dc]) => [r + dr, c + dc]
-            );
-            const cellKeys = cells.map(
-              /** @type {(cell: Cell) => `${number},${number}`} */
-              ([row, col]) => `${row},${col}`
-            );
+        // A blank piece has no cells to place
+        if (orientation.length === 0) continue;
+
+        const height = Math.max(...orientation.map(([dr]) => dr)) + 1;
+        const width = Math.max(...orientation.map(([, dc]) => dc)) + 1;
+
+        // Bitboard of the orientation anchored at (0, 0). Moving it to (r, c)
+        // multiplies it by 2^(r * 7 + c), which is exact for 49-bit values in
+        // a double, so placements need no per-cell work until they're kept.
+        const shape = orientation.reduce(
+          (bits, [dr, dc]) => bits + 2 ** (dr * this.cols + dc),
+          0
+        );
+
+        for (let r = 0; r + height <= this.rows; r++) {
+          for (let c = 0; c + width <= this.cols; c++) {
+            const bits = shape * 2 ** (r * this.cols + c);
+            const lo = bits % 2 ** HI_WORD_OFFSET;
+            const hi = (bits - lo) / 2 ** HI_WORD_OFFSET;
 
             // Check if all cells are valid
-            const allValid = cellKeys.every((key) => this.validCells.has(key));
-
-            if (allValid) {
-              // Convert to bitboard
-              let bitboard = 0n;
-              for (const key of cellKeys) {
-                const index = this.cellToIndex.get(key);
-                if (index !== undefined) {
-                  bitboard |= 1n << BigInt(index);
-                }
-              }
-
-              placements.push({
-                pieceIdx,
-                r,
-                c,
-                bits: bitboard,
-                cellsList: cells,
-              });
+            if ((lo & ~this.validLo) !== 0 || (hi & ~this.validHi) !== 0) {
+              continue;
             }
+
+            placements.push({
+              pieceIdx,
+              r,
+              c,
+              lo,
+              hi,
+              // Orientations are normalized in row-major order, so the
+              // shifted cells are already sorted for the solution output.
+              // Every solution using this placement shares the list, so it's
+              // frozen to keep callers from editing it.
+              cellsList: Object.freeze(
+                orientation.map(
+                  ([dr, dc]) =>
+                    /** @type {Cell} */ (Object.freeze([r + dr, c + dc]))
+                )
+              ),
+            });
           }
         }
       }
-      allPlacements.push(placements);
     }
 
-    return allPlacements;
+    return placements;
   }
 
   /**
-   * Compute dynamic piece ordering based on placement constraints.
-   * Places most constrained pieces first to prune search space earlier.
-   * @param {Placement[][]} filteredPlacements
-   * @returns {number[]}
+   * Build the exact cover tables for a list of placements.
+   * @param {Placement[]} placements
+   * @returns {SearchTables}
+   */
+  buildSearchTables(placements) {
+    // Exact cover columns: the placements covering cell `i` are stored at
+    // `cellPlacements[cellOffsets[i]]` to `cellPlacements[cellOffsets[i + 1]]`
+    const cellCounts = new Int32Array(this.rows * this.cols);
+    for (const placement of placements) {
+      for (const [r, c] of placement.cellsList) {
+        const cell = r * this.cols + c;
+        cellCounts[cell] = (cellCounts[cell] ?? 0) + 1;
+      }
+    }
+    const cellOffsets = new Int32Array(cellCounts.length + 1);
+    for (let cell = 0; cell < cellCounts.length; cell++) {
+      cellOffsets[cell + 1] =
+        (cellOffsets[cell] ?? 0) + (cellCounts[cell] ?? 0);
+    }
+    const cellPlacements = new Int32Array(
+      cellOffsets[cellCounts.length] ?? 0
+    );
+    const nextSlot = cellOffsets.slice(0, -1);
+    placements.forEach((placement, placementIdx) => {
+      for (const [r, c] of placement.cellsList) {
+        const cell = r * this.cols + c;
+        const slot = nextSlot[cell] ?? 0;
+        cellPlacements[slot] = placementIdx;
+        nextSlot[cell] = slot + 1;
+      }
+    });
+
+    // For every set of used pieces, the smallest unused piece size, and the
+    // size shared by all unused pieces (0 if their sizes differ)
+    const minPieceSize = new Int32Array(1 << this.pieces.length);
+    const uniformPieceSize = new Int32Array(1 << this.pieces.length);
+    for (let usedPieces = 0; usedPieces < minPieceSize.length; usedPieces++) {
+      const sizes = this.pieces
+        .filter((_, pieceIdx) => (usedPieces & (1 << pieceIdx)) === 0)
+        .map((piece) => piece.length);
+      if (sizes.length === 0) continue;
+      minPieceSize[usedPieces] = Math.min(...sizes);
+      uniformPieceSize[usedPieces] = sizes.every((size) => size === sizes[0])
+        ? sizes[0] ?? 0
+        : 0;
+    }
+
+    return {
+      placementLo: Int32Array.from(placements, (p) => p.lo),
+      placementHi: Int32Array.from(placements, (p) => p.hi),
+      placementPiece: Int32Array.from(placements, (p) => p.pieceIdx),
+      cellOffsets,
+      cellPlacements,
+      minPieceSize,
+      uniformPieceSize,
+      allPieces: (1 << this.pieces.length) - 1,
+      targetLo: this.validLo,
+      targetHi: this.validHi,
+    };
+  }
+
+  /**
+   * Get the search tables for one date, with every placement that covers the
+   * month or day cell dropped from the column lists, since the search never
+   * needs to look at those placements. Only the last date's tables are
+   * kept, so repeated solves of one date reuse them without the cache
+   * growing with every date solved.
+   * @param {Month} month
+   * @param {number} day
+   * @param {number} forbiddenLo Low word of the month and day cells
+   * @param {number} forbiddenHi High word of the month and day cells
+   * @returns {SearchTables}
    */
-  computePieceOrder(filteredPlacements) {
-    // Count valid placements per piece
-    const counts = filteredPlacements.map((placements, idx) => ({
-      idx,
-      count: placements.length,
-    }));
+  getDateSearchTables(month, day, forbiddenLo, forbiddenHi) {
+    const key = dateKey(month, day);
+    if (this.dateSearchTables?.key === key) {
+      return this.dateSearchTables.tables;
+    }
 
-    // Sort by count ascending (most constrained first)
-    counts.sort((a, b) => a.count - b.count);
+    const { placementLo, placementHi, cellOffsets, cellPlacements } =
+      this.searchTables;
+    const dateOffsets = new Int32Array(cellOffsets.length);
+    const datePlacements = new Int32Array(cellPlacements.length);
+    let size = 0;
+    for (let cell = 0; cell + 1 < cellOffsets.length; cell++) {
+      const end = cellOffsets[cell + 1] ?? 0;
+      for (let i = cellOffsets[cell] ?? 0; i < end; i++) {
+        const p = cellPlacements[i] ?? 0;
+        if (
+          ((placementLo[p] ?? 0) & forbiddenLo) === 0 &&
+          ((placementHi[p] ?? 0) & forbiddenHi) === 0
+        ) {
+          datePlacements[size++] = p;
+        }
+      }
+      dateOffsets[cell + 1] = size;
+    }
 
-    return counts.map((c) => c.idx);
+    /** @type {SearchTables} */
+    const tables = {
+      ...this.searchTables,
+      cellOffsets: dateOffsets,
+      cellPlacements: datePlacements.slice(0, size),
+    };
+    this.dateSearchTables = { key, tables };
+    return tables;
   }
 
   /**
@@ -428,86 +584,290 @@ class CalendarPuzzle {
       throw new Error(`Invalid month or day: ${month}, ${day}`);
     }
 
-    const forbiddenIdx1 = this.cellToIndex.get(
-      `${monthCell[0]},${monthCell[1]}`
+    // Start with the month and day cells already covered, so placements
+    // over them fail the ordinary overlap test
+    const [forbiddenLo, forbiddenHi] = this.cellsToBits([monthCell, dayCell]);
+
+    const chosen = new Int32Array(this.pieces.length);
+    const found = searchExactCover(
+      this.getDateSearchTables(month, day, forbiddenLo, forbiddenHi),
+      0,
+      forbiddenLo,
+      forbiddenHi,
+      0,
+      chosen
     );
-    const forbiddenIdx2 = this.cellToIndex.get(`${dayCell[0]},${dayCell[1]}`);
 
-    if (forbiddenIdx1 === undefined || forbiddenIdx2 === undefined) {
-      throw new Error(`Invalid cell indices for month or day`);
-    }
+    return found ? this.decodeSolution(Array.from(chosen)) : null;
+  }
 
-    // Create forbidden bitboard
-    let forbiddenBits = 0n;
-    forbiddenBits |= 1n << BigInt(forbiddenIdx1);
-    forbiddenBits |= 1n << BigInt(forbiddenIdx2);
+  /**
+   * Look a date up in a precomputed solution table. The entry is checked
+   * against the current pieces before it is used, so a table left over
+   * from different piece definitions is treated as a miss.
+   * @param {SolutionTable} table
+   * @param {Month} month
+   * @param {number} day
+   * @returns {Solution[] | null} The solution, or null on a miss
+   */
+  lookupSolution(table, month, day) {
+    const monthCell = this.months[month];
+    const dayCell = this.days[day];
+    const placementIdxs = table[dateKey(month, day)];
+    if (!monthCell || !dayCell || !placementIdxs) return null;
+
+    let [coveredLo, coveredHi] = this.cellsToBits([monthCell, dayCell]);
+    let usedPieces = 0;
+    for (const placementIdx of placementIdxs) {
+      const placement = this.placements[placementIdx];
+      if (
+        !placement ||
+        (coveredLo & placement.lo) !== 0 ||
+        (coveredHi & placement.hi) !== 0 ||
+        (usedPieces & (1 << placement.pieceIdx)) !== 0
+      ) {
+        return null;
+      }
+      coveredLo |= placement.lo;
+      coveredHi |= placement.hi;
+      usedPieces |= 1 << placement.pieceIdx;
+    }
+    if (
+      coveredLo !== this.validLo ||
+      coveredHi !== this.validHi ||
+      usedPieces !== this.searchTables.allPieces
+    ) {
+      return null;
+    }
 
-    // Target: all valid cells except forbidden ones
-    const targetBits =
-      (1n << BigInt(this.validCells.size)) - 1n - forbiddenBits;
+    return this.decodeSolution(placementIdxs);
+  }
 
-    // Filter pre-computed placements by forbidden bits
-    const allPlacements = this.globalPlacements.map((placements) =>
-      placements.filter((p) => (p.bits & forbiddenBits) === 0n)
-    );
+  /**
+   * @param {number[]} placementIdxs Indices into `this.placements`
+   * @returns {Solution[]}
+   */
+  decodeSolution(placementIdxs) {
+    return placementIdxs.map((placementIdx) => {
+      const placement = /** @type {Placement} */ (
+        this.placements[placementIdx]
+      );
+      return {
+        pieceIdx: placement.pieceIdx,
+        placementIdx,
+        r: placement.r,
+        c: placement.c,
+        cells: placement.cellsList,
+      };
+    });
+  }
+}
 
-    // Compute piece ordering (most constrained first for better pruning)
-    const pieceOrder = this.computePieceOrder(allPlacements);
+/**
+ * @param {Month} month
+ * @param {number} day
+ * @returns {string} The key for a date in per-date caches and tables
+ */
+function dateKey(month, day) {
+  return `${month},${day}`;
+}
 
-    // Backtracking search with bitboards
-    let coveredBits = 0n;
-    /** @type {Placement[]} */
-    const solution = [];
+/**
+ * @param {number} x
+ * @returns {number} The number of set bits in `x`
+ */
+function popcount32(x) {
+  x -= (x >>> 1) & 0x55555555;
+  x = (x & 0x33333333) + ((x >>> 2) & 0x33333333);
+  x = (x + (x >>> 4)) & 0x0f0f0f0f;
+  return Math.imul(x, 0x01010101) >>> 24;
+}
 
-    /**
-     *
-     * @param {number} depth The current depth in the search tree
-     * @returns {boolean}
-     */
-    const backtrack = (depth) => {
-      if (depth === this.pieces.length) {
-        return coveredBits === targetBits;
-      }
+/**
+ * Check whether every connected region of open cells can still be filled by
+ * the unused pieces. A region smaller than the smallest unused piece can't
+ * be filled, and when the unused pieces all have the same size, every
+ * region's size must be a multiple of it.
+ * @param {SearchTables} tables
+ * @param {number} openLo Low word of the cells still to cover
+ * @param {number} openHi High word of the cells still to cover
+ * @param {number} usedPieces Bitmask of pieces already on the board
+ * @returns {boolean}
+ */
+function regionsFillable(tables, openLo, openHi, usedPieces) {
+  const minSize = tables.minPieceSize[usedPieces] ?? 0;
+  const uniformSize = tables.uniformPieceSize[usedPieces] ?? 0;
+
+  let remainingLo = openLo;
+  let remainingHi = openHi;
+  while (remainingLo !== 0 || remainingHi !== 0) {
+    // Seed a flood fill from the lowest remaining cell
+    let frontierLo = remainingLo & -remainingLo;
+    let frontierHi = frontierLo === 0 ? remainingHi & -remainingHi : 0;
+    let regionLo = frontierLo;
+    let regionHi = frontierHi;
+
+    while (frontierLo !== 0 || frontierHi !== 0) {
+      // Step every frontier cell one cell left, right, up and down at once.
+      // Row 3 is the low word's last row and row 4 the high word's first.
+      const nextLo =
+        ((frontierLo << 1) & NOT_COL_0) |
+        ((frontierLo >>> 1) & NOT_COL_6) |
+        (frontierLo << 7) |
+        (frontierLo >>> 7) |
+        ((frontierHi & ROW_MASK) << (HI_WORD_OFFSET - 7));
+      const nextHi =
+        ((frontierHi << 1) & NOT_COL_0) |
+        ((frontierHi >>> 1) & NOT_COL_6) |
+        (frontierHi << 7) |
+        (frontierHi >>> 7) |
+        (frontierLo >>> (HI_WORD_OFFSET - 7));
+      frontierLo = nextLo & openLo & ~regionLo;
+      frontierHi = nextHi & openHi & ~regionHi;
+      regionLo |= frontierLo;
+      regionHi |= frontierHi;
+    }
 
-      // Use dynamic piece ordering
-      const pieceIdx = pieceOrder[depth];
-      if (pieceIdx === undefined) return false;
+    const size = popcount32(regionLo) + popcount32(regionHi);
+    if (size < minSize || (uniformSize !== 0 && size % uniformSize !== 0)) {
+      return false;
+    }
+    remainingLo &= ~regionLo;
+    remainingHi &= ~regionHi;
+  }
 
-      const piecePlacements = allPlacements[pieceIdx];
-      if (!piecePlacements) return false;
+  return true;
+}
 
-      for (const placement of piecePlacements) {
-        // Check overlap
-        if ((coveredBits & placement.bits) === 0n) {
-          // No overlap, place the piece
-          coveredBits |= placement.bits;
-          solution.push(placement);
+/**
+ * Count the placements covering `cell` that fit on the current board,
+ * stopping once the count reaches `limit`.
+ * @param {SearchTables} tables
+ * @param {number} cell Bit index of the cell
+ * @param {number} coveredLo
+ * @param {number} coveredHi
+ * @param {number} usedPieces Bitmask of pieces already on the board
+ * @param {number} limit Count at which the caller loses interest
+ * @returns {number}
+ */
+function countCandidates(
+  tables,
+  cell,
+  coveredLo,
+  coveredHi,
+  usedPieces,
+  limit
+) {
+  const end = tables.cellOffsets[cell + 1] ?? 0;
+  let count = 0;
+  for (let i = tables.cellOffsets[cell] ?? 0; i < end && count < limit; i++) {
+    const p = tables.cellPlacements[i] ?? 0;
+    if (
+      (coveredLo & (tables.placementLo[p] ?? 0)) === 0 &&
+      (coveredHi & (tables.placementHi[p] ?? 0)) === 0 &&
+      (usedPieces & (1 << (tables.placementPiece[p] ?? 0))) === 0
+    ) {
+      count++;
+    }
+  }
+  return count;
+}
 
-          if (backtrack(depth + 1)) {
-            return true;
-          }
+/**
+ * Algorithm X over placement bitboards.
+ *
+ * Every uncovered target cell is a primary column. Pieces are secondary
+ * columns: they may be used at most once, and a cover only counts as a
+ * solution once every piece is on the board, which rules out piece sets
+ * whose areas don't add up to the target area. At each step the search
+ * branches on the cell with the fewest fitting placements.
+ *
+ * Kept free of closures so that V8 can compile it down to monomorphic
+ * integer code.
+ *
+ * @param {SearchTables} tables
+ * @param {number} depth The current depth in the search tree
+ * @param {number} coveredLo Low word of the cells covered so far
+ * @param {number} coveredHi High word of the cells covered so far
+ * @param {number} usedPieces Bitmask of pieces already on the board
+ * @param {Int32Array} chosen Receives the placement index chosen at each depth
+ * @returns {boolean}
+ */
+function searchExactCover(
+  tables,
+  depth,
+  coveredLo,
+  coveredHi,
+  usedPieces,
+  chosen
+) {
+  const openLo = tables.targetLo & ~coveredLo;
+  const openHi = tables.targetHi & ~coveredHi;
+  if (openLo === 0 && openHi === 0) {
+    return usedPieces === tables.allPieces;
+  }
+  if (!regionsFillable(tables, openLo, openHi, usedPieces)) {
+    return false;
+  }
 
-          // Backtrack
-          coveredBits ^= placement.bits;
-          solution.pop();
-        }
+  // Choose the open cell with the fewest candidates
+  let bestCell = -1;
+  let bestCount = Infinity;
+  for (let word = 0; word < 2 && bestCount > 1; word++) {
+    let open = word === 0 ? openLo : openHi;
+    while (open !== 0 && bestCount > 1) {
+      const bit = open & -open;
+      open ^= bit;
+      const cell = 31 - Math.clz32(bit) + word * HI_WORD_OFFSET;
+      const count = countCandidates(
+        tables,
+        cell,
+        coveredLo,
+        coveredHi,
+        usedPieces,
+        bestCount
+      );
+      if (count === 0) {
+        // Nothing fits here, so this board is a dead end
+        return false;
       }
+      if (count < bestCount) {
+        bestCell = cell;
+        bestCount = count;
+      }
+    }
+  }
 
-      return false;
-    };
-
-    if (backtrack(0)) {
-      return solution.map((placement) => ({
-        pieceIdx: placement.pieceIdx,
-        r: placement.r,
-        c: placement.c,
-        cells: placement.cellsList
-          .slice()
-          .sort((a, b) => (a[0] !== b[0] ? a[0] - b[0] : a[1] - b[1])),
-      }));
+  const end = tables.cellOffsets[bestCell + 1] ?? 0;
+  for (let i = tables.cellOffsets[bestCell] ?? 0; i < end; i++) {
+    const p = tables.cellPlacements[i] ?? 0;
+    const lo = tables.placementLo[p] ?? 0;
+    const hi = tables.placementHi[p] ?? 0;
+    const pieceBit = 1 << (tables.placementPiece[p] ?? 0);
+
+    // Check overlap
+    if (
+      (coveredLo & lo) === 0 &&
+      (coveredHi & hi) === 0 &&
+      (usedPieces & pieceBit) === 0
+    ) {
+      chosen[depth] = p;
+      if (
+        searchExactCover(
+          tables,
+          depth + 1,
+          coveredLo | lo,
+          coveredHi | hi,
+          usedPieces | pieceBit,
+          chosen
+        )
+      ) {
+        return true;
+      }
     }
-    return null;
   }
+
+  return false;
 }
 
-export { CalendarPuzzle };
+export { CalendarPuzzle, dateKey };
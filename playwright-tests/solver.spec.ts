@@ -0,0 +1,160 @@
+import { test, expect } from "@playwright/test";
+
+// Kept in variables so TypeScript doesn't try to resolve the page's modules
+const puzzleModule = "/CalendarPuzzle.js";
+const poolModule = "/solverPool.js";
+
+test.describe("Calendar Puzzle Solver", () => {
+  test.beforeEach(async ({ page }) => {
+    await page.goto("/");
+  });
+
+  test("should find a valid tiling for every month and day", async ({
+    page,
+  }) => {
+    const failures = await page.evaluate(async (modulePath) => {
+      const { CalendarPuzzle } = await import(modulePath);
+      const puzzle = new CalendarPuzzle();
+
+      const problems: string[] = [];
+      for (const month of Object.keys(puzzle.months)) {
+        for (let day = 1; day <= 31; day++) {
+          const date = `${month} ${day}`;
+          const solution = puzzle.solveBacktrack(month, day);
+          if (!solution) {
+            problems.push(`${date}: no solution`);
+            continue;
+          }
+          if (solution.length !== puzzle.pieces.length) {
+            problems.push(`${date}: ${solution.length} pieces placed`);
+          }
+
+          // Every non-target cell is covered by exactly one piece
+          const [monthRow, monthCol] = puzzle.months[month];
+          const [dayRow, dayCol] = puzzle.days[day];
+          const covered = new Set<string>([
+            `${monthRow},${monthCol}`,
+            `${dayRow},${dayCol}`,
+          ]);
+          const usedPieces = new Set<number>();
+          for (const { pieceIdx, cells } of solution) {
+            if (usedPieces.has(pieceIdx)) {
+              problems.push(`${date}: piece ${pieceIdx} placed twice`);
+            }
+            usedPieces.add(pieceIdx);
+            if (cells.length !== puzzle.pieces[pieceIdx].length) {
+              problems.push(`${date}: piece ${pieceIdx} has wrong size`);
+            }
+            for (const [r, c] of cells) {
+              const key = `${r},${c}`;
+              if (!puzzle.validCells.has(key)) {
+                problems.push(`${date}: piece ${pieceIdx} off board at ${key}`);
+              } else if (covered.has(key)) {
+                problems.push(`${date}: cell ${key} covered twice`);
+              }
+              covered.add(key);
+            }
+          }
+          if (covered.size !== puzzle.validCells.size) {
+            problems.push(`${date}: only ${covered.size} cells accounted for`);
+          }
+        }
+      }
+      return problems;
+    }, puzzleModule);
+
+    expect(failures).toEqual([]);
+  });
+
+  test("should serve precomputed solutions and reject bad entries", async ({
+    page,
+  }) => {
+    const results = await page.evaluate(async (modulePath) => {
+      const { CalendarPuzzle } = await import(modulePath);
+      const puzzle = new CalendarPuzzle();
+      const table: Record<string, number[]> = await (
+        await fetch("/solutions.json")
+      ).json();
+
+      const misses = Object.keys(table).filter((key) => {
+        const [month, day] = key.split(",");
+        return puzzle.lookupSolution(table, month, Number(day)) === null;
+      });
+
+      const jan1 = table["Jan,1"] ?? [];
+      const lookup = (entry: number[]) =>
+        puzzle.lookupSolution({ "Jan,1": entry }, "Jan", 1);
+      return {
+        entries: Object.keys(table).length,
+        misses,
+        otherDate: lookup(table["Jan,2"] ?? []),
+        short: lookup(jan1.slice(0, -1)),
+        duplicated: lookup([...jan1.slice(0, -1), jan1[0] ?? 0]),
+        outOfRange: lookup([...jan1.slice(0, -1), puzzle.placements.length]),
+        missingDate: puzzle.lookupSolution(table, "Feb", 30),
+      };
+    }, puzzleModule);
+
+    expect(results.entries).toBe(366);
+    expect(results.misses).toEqual([]);
+    expect(results.otherDate).toBeNull();
+    expect(results.short).toBeNull();
+    expect(results.duplicated).toBeNull();
+    expect(results.outOfRange).toBeNull();
+    expect(results.missingDate).toBeNull();
+  });
+
+  test("should solve a batch of dates on the worker pool", async ({ page }) => {
+    const results = await page.evaluate(async (modulePath) => {
+      const { SolverPool } = await import(modulePath);
+      const pool = new SolverPool(2);
+      try {
+        const dates = [
+          { month: "Jan", day: 1 },
+          { month: "Mar", day: 14 },
+          { month: "Jul", day: 4 },
+          { month: "Dec", day: 31 },
+        ];
+        const solved = await pool.solveAll(dates);
+
+        let rejection = null;
+        try {
+          await pool.solveAll([
+            { month: "Feb", day: 2 },
+            { month: "Foo", day: 1 },
+            { month: "Feb", day: 3 },
+          ]);
+        } catch (error) {
+          rejection = error instanceof Error ? error.message : String(error);
+        }
+
+        // A bad date fails only its own batch
+        const after = await pool.solveAll([{ month: "Oct", day: 9 }]);
+
+        const summarize = (
+          results: { month: string; day: number; solution: unknown[] }[]
+        ) =>
+          results.map(
+            ({ month, day, solution }) =>
+              `${month} ${day}: ${solution.length} pieces`
+          );
+        return {
+          solved: summarize(solved),
+          rejection,
+          after: summarize(after),
+        };
+      } finally {
+        pool.terminate();
+      }
+    }, poolModule);
+
+    expect(results.solved).toEqual([
+      "Jan 1: 8 pieces",
+      "Mar 14: 8 pieces",
+      "Jul 4: 8 pieces",
+      "Dec 31: 8 pieces",
+    ]);
+    expect(results.rejection).toBe("Invalid month or day: Foo, 1");
+    expect(results.after).toEqual(["Oct 9: 8 pieces"]);
+  });
+});
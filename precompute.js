@@ -0,0 +1,69 @@
+// @ts-check
+
+import { writeFile } from "node:fs/promises";
+import { dateKey } from "./CalendarPuzzle.js";
+import { SolverPool } from "./solverPool.js";
+
+/** @typedef {import("./CalendarPuzzle.js").Month} Month */
+/** @typedef {import("./CalendarPuzzle.js").SolutionTable} SolutionTable */
+/** @typedef {import("./solverPool.js").PuzzleDate} PuzzleDate */
+
+/**
+ * Solve every real calendar date and write the solutions to solutions.json,
+ * which the solver worker serves before falling back to a live search.
+ *
+ * Run with `bun run precompute` after changing the piece definitions.
+ */
+
+/** @type {Month[]} */
+const monthNames = [
+  "Jan",
+  "Feb",
+  "Mar",
+  "Apr",
+  "May",
+  "Jun",
+  "Jul",
+  "Aug",
+  "Sep",
+  "Oct",
+  "Nov",
+  "Dec",
+];
+
+/** @type {PuzzleDate[]} */
+const dates = monthNames.flatMap((month, monthIdx) => {
+  // Day 0 of the next month is the last day of this one; 2024 is a leap year,
+  // so February gets its 29th
+  const daysInMonth = new Date(2024, monthIdx + 1, 0).getDate();
+  return Array.from({ length: daysInMonth }, (_, i) => ({ month, day: i + 1 }));
+});
+
+const pool = new SolverPool();
+try {
+  const startTime = performance.now();
+  // Search every date rather than reading back the current solutions.json
+  const results = await pool.solveAll(dates, { live: true });
+
+  /** @type {SolutionTable} */
+  const table = {};
+  for (const { month, day, solution } of results) {
+    if (solution) {
+      table[dateKey(month, day)] = solution.map((p) => p.placementIdx);
+    } else {
+      console.warn(`No solution for ${month} ${day}`);
+    }
+  }
+
+  await writeFile(
+    new URL("./solutions.json", import.meta.url),
+    JSON.stringify(table) + "\n"
+  );
+  console.log(
+    `Solved ${Object.keys(table).length} of ${dates.length} dates in ${Math.round(
+      performance.now() - startTime
+    )}ms`
+  );
+} finally {
+  pool.terminate();
+}
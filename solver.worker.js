@@ -3,25 +3,36 @@
 import { CalendarPuzzle } from "./CalendarPuzzle.js";
 
 /** @typedef {import("./CalendarPuzzle.js").Month} Month */
+/** @typedef {import("./CalendarPuzzle.js").SolutionTable} SolutionTable */
 
 // Create puzzle instance
 const puzzle = new CalendarPuzzle();
 
+// Load the precomputed solutions, if they've been generated. Dates missing
+// from the table are solved live.
+/** @type {Promise<SolutionTable>} */
+const solutionTable = fetch(new URL("./solutions.json", import.meta.url))
+  .then((response) => (response.ok ? response.json() : {}))
+  .catch(() => ({}));
+
 // Listen for messages from main thread
-self.addEventListener("message", (/** @type {MessageEvent} */ e) => {
-  const { month, day } = e.data;
+self.addEventListener("message", async (/** @type {MessageEvent} */ e) => {
+  // `live` skips the precomputed table, e.g. when regenerating it
+  const { id, month, day, live } = e.data;
 
   try {
+    const table = live ? {} : await solutionTable;
+
     // Solve the puzzle
     const startTime = performance.now();
-    const solution = puzzle.solveBacktrack(
-      /** @type {Month} */ (month),
-      Number(day)
-    );
+    const solution =
+      puzzle.lookupSolution(table, month, Number(day)) ??
+      puzzle.solveBacktrack(/** @type {Month} */ (month), Number(day));
     const solveTimeMs = performance.now() - startTime;
 
     // Send result back to main thread
     self.postMessage({
+      id,
       success: true,
       solution,
       month,
@@ -32,6 +43,7 @@ self.addEventListener("message", (/** @type {MessageEvent} */ e) => {
     // Send error back to main thread
     const errorMessage = error instanceof Error ? error.message : String(error);
     self.postMessage({
+      id,
       success: false,
       error: errorMessage,
       month,
@@ -0,0 +1,177 @@
+// @ts-check
+
+/** @typedef {import("./CalendarPuzzle.js").Month} Month */
+/** @typedef {import("./CalendarPuzzle.js").Solution} Solution */
+
+/**
+ * @typedef {{
+ *   month: Month,
+ *   day: number,
+ * }} PuzzleDate
+ */
+
+/**
+ * @typedef {{
+ *   month: Month,
+ *   day: number,
+ *   solution: Solution[] | null,
+ *   solveTimeMs: number,
+ * }} DateSolution
+ */
+
+/**
+ * Solves many dates in parallel on a pool of solver workers.
+ *
+ * Each worker builds its puzzle tables once at startup and then handles
+ * every date it is handed. Dates come off a shared queue one at a time as
+ * workers finish, so a worker that draws a few slow dates doesn't hold up
+ * the others.
+ */
+class SolverPool {
+  /**
+   * @param {number} [size] Number of workers to start
+   */
+  constructor(size = navigator.hardwareConcurrency || 4) {
+    /** @type {Worker[]} */
+    this.workers = Array.from(
+      { length: Math.max(1, size) },
+      () =>
+        new Worker(new URL("./solver.worker.js", import.meta.url), {
+          type: "module",
+        })
+    );
+
+    /**
+     * Id of the next request sent to a worker. Replies are matched on it,
+     * so stragglers from an earlier, failed batch are ignored.
+     * @type {number}
+     */
+    this.nextRequestId = 0;
+
+    /**
+     * Set once any worker fails. A dead worker never replies, so every
+     * later batch is rejected with this error.
+     * @type {Error | null}
+     */
+    this.error = null;
+
+    /**
+     * Rejects the batch in flight, if there is one.
+     * @type {((error: Error) => void) | null}
+     */
+    this.failBatch = null;
+
+    // Listen from the start: a module that fails to load can fire its error
+    // before the first batch is submitted
+    for (const worker of this.workers) {
+      worker.onerror = (e) => {
+        e.preventDefault();
+        this.fail(new Error(`Solver worker failed: ${e.message}`));
+      };
+      worker.onmessageerror = () => {
+        this.fail(
+          new Error("Solver worker sent a message that couldn't be read")
+        );
+      };
+    }
+  }
+
+  /**
+   * Mark the pool as broken and reject the batch in flight.
+   * @param {Error} error
+   */
+  fail(error) {
+    this.error ??= error;
+    this.failBatch?.(error);
+  }
+
+  /**
+   * Solve every date. Only one batch may be in flight at a time.
+   * @param {PuzzleDate[]} dates
+   * @param {{ live?: boolean }} [options] Pass `live: true` to search every
+   *   date instead of answering from the precomputed solutions
+   * @returns {Promise<DateSolution[]>} Solutions in the same order as `dates`
+   */
+  solveAll(dates, { live = false } = {}) {
+    return new Promise((resolve, reject) => {
+      /** @type {DateSolution[]} */
+      const results = new Array(dates.length);
+      let nextIdx = 0;
+      let doneCount = 0;
+      let failed = false;
+
+      if (this.error) {
+        reject(this.error);
+        return;
+      }
+      if (dates.length === 0) {
+        resolve(results);
+        return;
+      }
+
+      /** @param {Error} error */
+      const fail = (error) => {
+        if (failed) return;
+        failed = true;
+        this.failBatch = null;
+        reject(error);
+      };
+      this.failBatch = fail;
+
+      /**
+       * Hand the next queued date to a worker that just became idle.
+       * @param {Worker} worker
+       */
+      const dispatch = (worker) => {
+        if (failed || nextIdx >= dates.length) return;
+        const idx = nextIdx++;
+        const date = /** @type {PuzzleDate} */ (dates[idx]);
+        const requestId = this.nextRequestId++;
+
+        worker.onmessage = (/** @type {MessageEvent} */ e) => {
+          const { id, success, solution, solveTimeMs, error } = e.data;
+          if (id !== requestId) return;
+          if (!success) {
+            fail(new Error(error));
+            return;
+          }
+
+          results[idx] = {
+            month: date.month,
+            day: date.day,
+            solution,
+            solveTimeMs,
+          };
+          doneCount++;
+          if (doneCount === dates.length) {
+            this.failBatch = null;
+            resolve(results);
+          } else {
+            dispatch(worker);
+          }
+        };
+        worker.postMessage({
+          id: requestId,
+          month: date.month,
+          day: date.day,
+          live,
+        });
+      };
+
+      for (const worker of this.workers) {
+        dispatch(worker);
+      }
+    });
+  }
+
+  /**
+   * Stop all workers. The pool can't be used afterwards.
+   */
+  terminate() {
+    for (const worker of this.workers) {
+      worker.terminate();
+    }
+  }
+}
+
+export { SolverPool };